@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 
+import heapq
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from operator import attrgetter
 
 from src.collectors.rss_collector import RSSCollector
 from src.collectors.github_collector import GitHubCollector
@@ -28,7 +27,12 @@ def main():
         logger.error("Configuration validation failed")
         sys.exit(1)
     
+    slack_notifier = None
+    
     try:
+        # 収集中のエラーも通知するため、最初に作成しておく
+        slack_notifier = SlackNotifier()
+        
         # 各データソースから記事を収集
         logger.info("Starting article collection from all sources")
         
@@ -40,10 +44,17 @@ def main():
         
         all_articles = []
         
-        for name, collector in collectors:
-            try:
+        # 各コレクターはI/O待ちが中心なのでスレッドで並行実行する
+        with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+            futures = []
+            for name, collector in collectors:
                 logger.info(f"Collecting from {name}")
-                articles = collector.collect()
+                futures.append((name, executor.submit(collector.collect)))
+        
+        # 重複除去の優先順位が変わらないよう、結果はコレクターの定義順に集約
+        for name, future in futures:
+            try:
+                articles = future.result()
                 all_articles.extend(articles)
                 stats.add_source_stats(name.lower(), len(articles))
                 logger.info(f"Collected {len(articles)} articles from {name}")
@@ -52,6 +63,7 @@ def main():
                 error_msg = f"Failed to collect from {name}: {e}"
                 logger.error(error_msg)
                 stats.add_error(name.lower(), str(e))
+                slack_notifier.send_error_notification(error_msg)
         
         logger.info(f"Total articles collected: {len(all_articles)}")
         
@@ -72,12 +84,16 @@ def main():
             return
         
         # 上位記事のみ選択
-        top_articles = processed_articles[:Config.MAX_ARTICLES_PER_NOTIFICATION]
+        # 全件ソートせず、スコア上位のみをヒープで取り出す
+        top_articles = heapq.nlargest(
+            Config.MAX_ARTICLES_PER_NOTIFICATION,
+            processed_articles,
+            key=attrgetter("score")
+        )
         logger.info(f"Selected top {len(top_articles)} articles for notification")
         
         # Slack通知
         logger.info("Sending notification to Slack")
-        slack_notifier = SlackNotifier()
         success = slack_notifier.send_daily_summary(top_articles)
         
         if success:
@@ -93,7 +109,8 @@ def main():
         
         # エラー通知を送信
         try:
-            slack_notifier = SlackNotifier()
+            if slack_notifier is None:
+                slack_notifier = SlackNotifier()
             slack_notifier.send_error_notification(error_msg)
         except:
             pass  # エラー通知の失敗は無視
@@ -101,6 +118,10 @@ def main():
         sys.exit(1)
     
     finally:
+        # まとめて送る前のエラー通知が残っていれば、待たずに送信する
+        if slack_notifier is not None:
+            slack_notifier.flush_error_notifications()
+        
         # 統計情報をログ出力
         logger.info(stats.get_summary())
         logger.info("=== Tech News Collection Completed ===")
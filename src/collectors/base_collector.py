@@ -1,24 +1,92 @@
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
 from datetime import datetime, timedelta
 import re
 
 from ..models.article import Article
+from ..utils.config import Config
+from ..utils.keyword_matcher import compile_keywords
 from ..utils.logger import setup_logger
 
 
+# スコアリング用の技術キーワード
+_TECH_KEYWORDS = [
+    "ai", "machine learning", "python", "javascript", "react", "nodejs",
+    "docker", "kubernetes", "aws", "cloud", "api", "microservices",
+    "blockchain", "rust", "go", "typescript", "devops", "security"
+]
+
+# スコアを減点する除外キーワード
+_EXCLUDE_KEYWORDS = ["advertisement", "sponsored", "crypto scam"]
+
+# 技術タグとそのタグに対応するキーワード
+_TAG_KEYWORDS = {
+    "python": ["python"],
+    "javascript": ["javascript", "js"],
+    "react": ["react"],
+    "nodejs": ["nodejs", "node.js"],
+    "docker": ["docker"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "aws": ["aws"],
+    "ai": ["ai", "artificial intelligence"],
+    "ml": ["machine learning", "ml"],
+    "api": ["api"],
+    "security": ["security"],
+    "devops": ["devops"],
+    "cloud": ["cloud"],
+    "rust": ["rust"],
+    "go": ["golang", "go"],
+    "typescript": ["typescript"]
+}
+
+# キーワード -> タグの逆引き
+# "node.js" は末尾の "js" 単体でも javascript として検出されていたため両方を割り当てる
+_KEYWORD_TAGS: Dict[str, Tuple[str, ...]] = {
+    keyword: (tag,) for tag, keywords in _TAG_KEYWORDS.items() for keyword in keywords
+}
+_KEYWORD_TAGS["node.js"] = ("nodejs", "javascript")
+
+# 正規表現はインポート時に一度だけコンパイルする
+_TAG_RE = compile_keywords(_KEYWORD_TAGS)
+_TECH_RE = compile_keywords(_TECH_KEYWORDS)
+_EXCLUDE_RE = compile_keywords(_EXCLUDE_KEYWORDS)
+_HTML_RE = re.compile(r'<[^>]+>')
+
+T = TypeVar("T")
+
+
 class BaseCollector(ABC):
     """データ収集の基底クラス"""
     
+    # _fetch_all で同時に取得する数の上限
+    MAX_WORKERS = 8
+    
     def __init__(self, source_name: str):
         self.source_name = source_name
         self.logger = setup_logger(f"collector.{source_name}")
+        self._cutoff: Optional[datetime] = None
+    
+    def _begin_run(self) -> datetime:
+        """収集開始時に実行ごとの状態を初期化（各collect()の先頭で呼ぶ）"""
+        self._cutoff = datetime.now() - timedelta(hours=Config.HOURS_LOOKBACK)
+        return self._cutoff
     
     @abstractmethod
     def collect(self) -> List[Article]:
         """記事を収集する（各サブクラスで実装）"""
         pass
     
+    def _fetch_all(self, fetch: Callable[[T], List[Article]], items: Sequence[T]) -> List[Tuple[T, "Future[List[Article]]"]]:
+        """items の各要素を fetch でスレッド並行に取得し、(要素, Future) を items の順に返す
+        
+        取得はI/O待ちが中心なのでスレッドで並行実行し、返す時点で全件完了している。
+        結果の集約順は items の定義順のまま変わらない。
+        """
+        max_workers = max(1, min(self.MAX_WORKERS, len(items)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [(item, executor.submit(fetch, item)) for item in items]
+    
     def _calculate_score(self, title: str, summary: str = "", **kwargs) -> float:
         """記事の重要度スコアを計算"""
         score = 0.0
@@ -26,16 +94,12 @@ class BaseCollector(ABC):
         # タイトルベースのスコアリング
         title_lower = title.lower()
         
-        # 技術キーワードのマッチング
-        tech_keywords = [
-            "ai", "machine learning", "python", "javascript", "react", "nodejs",
-            "docker", "kubernetes", "aws", "cloud", "api", "microservices",
-            "blockchain", "rust", "go", "typescript", "devops", "security"
-        ]
+        # 除外キーワードを含む記事は以降の計算をせずに0点とする
+        if _EXCLUDE_RE.search(title_lower):
+            return 0.0
         
-        for keyword in tech_keywords:
-            if keyword in title_lower:
-                score += 0.1
+        # 技術キーワードのマッチング（キーワードごとに1回だけ加点）
+        score += 0.1 * len(set(_TECH_RE.findall(title_lower)))
         
         # 人気指標（ある場合）
         if 'upvotes' in kwargs and kwargs['upvotes']:
@@ -54,60 +118,33 @@ class BaseCollector(ABC):
         if summary and len(summary) > 50:
             score += 0.1
         
-        # 除外キーワードチェック
-        exclude_keywords = ["advertisement", "sponsored", "crypto scam"]
-        for keyword in exclude_keywords:
-            if keyword in title_lower:
-                score -= 0.5
-        
         return min(max(score, 0.0), 1.0)
     
     def _extract_tags(self, title: str, content: str = "") -> List[str]:
         """タイトルと内容からタグを抽出"""
-        tags = []
         text = f"{title} {content}".lower()
         
-        # 技術タグの辞書
-        tag_patterns = {
-            "python": r"\bpython\b",
-            "javascript": r"\b(javascript|js)\b",
-            "react": r"\breact\b",
-            "nodejs": r"\b(nodejs|node\.js)\b",
-            "docker": r"\bdocker\b",
-            "kubernetes": r"\b(kubernetes|k8s)\b",
-            "aws": r"\baws\b",
-            "ai": r"\b(ai|artificial intelligence)\b",
-            "ml": r"\b(machine learning|ml)\b",
-            "api": r"\bapi\b",
-            "security": r"\bsecurity\b",
-            "devops": r"\bdevops\b",
-            "cloud": r"\bcloud\b",
-            "rust": r"\brust\b",
-            "go": r"\b(golang|go)\b",
-            "typescript": r"\btypescript\b"
-        }
-        
-        for tag, pattern in tag_patterns.items():
-            if re.search(pattern, text):
-                tags.append(tag)
+        # 全タグのキーワードを1回の走査で検出する
+        found: Set[str] = set()
+        for keyword in _TAG_RE.findall(text):
+            found.update(_KEYWORD_TAGS[keyword])
         
-        return tags
+        return [tag for tag in _TAG_KEYWORDS if tag in found]
     
-    def _is_recent(self, published_at: datetime, hours_back: int = 12) -> bool:
-        """指定された時間内の記事かチェック"""
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
-        return published_at >= cutoff_time
+    def _is_recent(self, published_at: datetime) -> bool:
+        """収集対象期間内の記事かチェック"""
+        cutoff = self._cutoff
+        if cutoff is None:
+            cutoff = self._begin_run()
+        return published_at >= cutoff
     
     def _clean_text(self, text: str) -> str:
         """テキストをクリーンアップ"""
         if not text:
             return ""
         
-        # HTMLタグを除去
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # 余分な空白を除去
-        text = re.sub(r'\s+', ' ', text).strip()
+        # HTMLタグを除去し、余分な空白の圧縮と前後の除去を split/join の1パスで行う
+        text = ' '.join(_HTML_RE.sub('', text).split())
         
         # 文字数制限
         if len(text) > 500:
@@ -1,3 +1,4 @@
+import orjson
 import requests
 from datetime import datetime, timedelta
 from typing import List, Optional
@@ -11,6 +12,9 @@ from ..utils.config import Config
 class GitHubCollector(BaseCollector):
     """GitHub トレンドリポジトリ収集クラス"""
     
+    # レート制限時に待機する最大秒数
+    MAX_RATE_LIMIT_WAIT = 60
+    
     def __init__(self):
         super().__init__("github")
         self.token = Config.GITHUB_TOKEN
@@ -26,26 +30,18 @@ class GitHubCollector(BaseCollector):
     
     def collect(self) -> List[Article]:
         """GitHubから人気リポジトリを収集"""
-        all_articles = []
+        self._begin_run()
+        languages = Config.GITHUB_TRENDING_LANGUAGES
         
-        # 各言語のトレンドリポジトリを取得
-        for language in Config.GITHUB_TRENDING_LANGUAGES:
-            try:
-                self.logger.info(f"Fetching GitHub trending for: {language}")
-                articles = self._collect_trending_repos(language)
-                all_articles.extend(articles)
-                self.logger.info(f"Collected {len(articles)} repos for {language}")
-                
-                # API制限対策
-                time.sleep(2)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to fetch GitHub trending for {language}: {e}")
+        # 全言語を1回の検索クエリにまとめて取得
+        self.logger.info(f"Fetching GitHub trending for: {', '.join(languages)}")
+        articles = self._collect_trending_repos(languages)
+        self.logger.info(f"Collected {len(articles)} repos for {len(languages)} languages")
         
-        return all_articles
+        return articles
     
-    def _collect_trending_repos(self, language: Optional[str] = None) -> List[Article]:
-        """特定言語のトレンドリポジトリを収集"""
+    def _collect_trending_repos(self, languages: Optional[List[str]] = None) -> List[Article]:
+        """指定言語のトレンドリポジトリを収集"""
         articles = []
         
         # 過去24時間で作成またはプッシュされたリポジトリを検索
@@ -56,8 +52,10 @@ class GitHubCollector(BaseCollector):
             "stars:>10"  # 最低10スター
         ]
         
-        if language:
-            query_parts.append(f"language:{language}")
+        # 言語はORで連結し、1リクエストで全言語を検索
+        if languages:
+            language_query = " OR ".join(f"language:{language}" for language in languages)
+            query_parts.append(f"({language_query})")
         
         query = " ".join(query_parts)
         
@@ -67,13 +65,13 @@ class GitHubCollector(BaseCollector):
                 "q": query,
                 "sort": "stars",
                 "order": "desc",
-                "per_page": 20  # 上位20個
+                "per_page": 100  # 1ページの上限
             }
             
-            response = self.session.get(url, params=params)
+            response = self._get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             for repo in data.get("items", []):
                 try:
@@ -84,10 +82,42 @@ class GitHubCollector(BaseCollector):
                     self.logger.error(f"Failed to process repo {repo.get('name', 'unknown')}: {e}")
             
         except Exception as e:
-            self.logger.error(f"Failed to fetch trending repos for {language}: {e}")
+            self.logger.error(f"Failed to fetch trending repos for {languages}: {e}")
         
         return articles
     
+    def _get(self, url: str, params: dict) -> requests.Response:
+        """レート制限ヘッダーに従ってGETする"""
+        response = self.session.get(url, params=params, timeout=30)
+        
+        wait_seconds = self._rate_limit_wait(response)
+        if wait_seconds is None:
+            return response
+        
+        # 待ち時間が長すぎる場合は待たずにエラーとして扱う
+        if wait_seconds > self.MAX_RATE_LIMIT_WAIT:
+            self.logger.warning(f"GitHub rate limit exceeded, resets in {wait_seconds:.0f}s")
+            return response
+        
+        self.logger.info(f"GitHub rate limit exceeded, retrying in {wait_seconds:.0f}s")
+        time.sleep(wait_seconds)
+        return self.session.get(url, params=params, timeout=30)
+    
+    def _rate_limit_wait(self, response: requests.Response) -> Optional[float]:
+        """レート制限に達している場合、再試行までの秒数を返す"""
+        if response.status_code not in (403, 429):
+            return None
+        
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            return float(retry_after)
+        
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset_at = float(response.headers.get("X-RateLimit-Reset", 0))
+            return max(reset_at - time.time(), 0) + 1
+        
+        return None
+    
     def _create_article_from_repo(self, repo: dict) -> Optional[Article]:
         """リポジトリデータから記事を作成"""
         try:
@@ -99,21 +129,21 @@ class GitHubCollector(BaseCollector):
             stars = repo.get("stargazers_count", 0)
             language = repo.get("language", "")
             
-            # 公開日時
+            # 公開日時（UTCで返るため、収集期間の判定に合わせてローカル時刻のnaiveなdatetimeに変換）
             created_at = datetime.fromisoformat(
                 repo.get("created_at", "").replace("Z", "+00:00")
-            )
+            ).astimezone().replace(tzinfo=None)
             
             # 更新日時も考慮
             updated_at = datetime.fromisoformat(
                 repo.get("updated_at", "").replace("Z", "+00:00")
-            )
+            ).astimezone().replace(tzinfo=None)
             
             # より最近の日時を使用
             published_at = max(created_at, updated_at)
             
             # 古すぎる場合はスキップ
-            if not self._is_recent(published_at, Config.HOURS_LOOKBACK):
+            if not self._is_recent(published_at):
                 return None
             
             # タイトルと概要を作成
@@ -130,6 +160,10 @@ class GitHubCollector(BaseCollector):
                 stars=stars
             )
             
+            # 除外対象（スコア0）はタグ抽出や記事生成を省略
+            if not score:
+                return None
+            
             # タグ抽出
             tags = self._extract_tags(title, summary)
             if language:
@@ -143,7 +177,7 @@ class GitHubCollector(BaseCollector):
                 source="github",
                 tags=tags,
                 score=score,
-                content_hash="",  # __post_init__で生成される
+                content_hash=0,  # __post_init__で生成される
                 author=repo.get("owner", {}).get("login", None)
             )
             
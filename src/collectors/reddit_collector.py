@@ -1,7 +1,7 @@
-import praw
+import orjson
+import requests
 from datetime import datetime
 from typing import List, Optional
-import time
 
 from .base_collector import BaseCollector
 from ..models.article import Article
@@ -11,86 +11,113 @@ from ..utils.config import Config
 class RedditCollector(BaseCollector):
     """Reddit 人気投稿収集クラス"""
     
+    TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+    API_BASE_URL = "https://oauth.reddit.com"
+    
     def __init__(self):
         super().__init__("reddit")
         self.client_id = Config.REDDIT_CLIENT_ID
         self.client_secret = Config.REDDIT_CLIENT_SECRET
         self.user_agent = Config.REDDIT_USER_AGENT
         
-        # Reddit API クライアント初期化
-        self.reddit = None
-        if self.client_id and self.client_secret:
-            try:
-                self.reddit = praw.Reddit(
-                    client_id=self.client_id,
-                    client_secret=self.client_secret,
-                    user_agent=self.user_agent
-                )
-                # Read-only mode設定
-                self.reddit.read_only = True
-            except Exception as e:
-                self.logger.error(f"Failed to initialize Reddit client: {e}")
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.user_agent})
     
     def collect(self) -> List[Article]:
         """Redditから人気投稿を収集"""
-        if not self.reddit:
-            self.logger.warning("Reddit client not initialized, skipping Reddit collection")
+        if not (self.client_id and self.client_secret):
+            self.logger.warning("Reddit credentials not configured, skipping Reddit collection")
             return []
         
+        if not self._authenticate():
+            self.logger.warning("Reddit authentication failed, skipping Reddit collection")
+            return []
+        
+        self._begin_run()
         all_articles = []
         
-        for subreddit_name in Config.REDDIT_SUBREDDITS:
+        futures = self._fetch_all(self._collect_from_subreddit, Config.REDDIT_SUBREDDITS)
+        
+        for subreddit_name, future in futures:
             try:
-                self.logger.info(f"Fetching posts from r/{subreddit_name}")
-                articles = self._collect_from_subreddit(subreddit_name)
+                articles = future.result()
                 all_articles.extend(articles)
                 self.logger.info(f"Collected {len(articles)} posts from r/{subreddit_name}")
-                
-                # API制限対策
-                time.sleep(2)
-                
+            
             except Exception as e:
                 self.logger.error(f"Failed to fetch from r/{subreddit_name}: {e}")
         
         return all_articles
     
+    def _authenticate(self) -> bool:
+        """アプリケーション認証でアクセストークンを取得"""
+        try:
+            response = self.session.post(
+                self.TOKEN_URL,
+                auth=(self.client_id, self.client_secret),
+                data={"grant_type": "client_credentials"},
+                timeout=30
+            )
+            response.raise_for_status()
+            
+            token = orjson.loads(response.content).get("access_token")
+            if not token:
+                return False
+            
+            self.session.headers.update({"Authorization": f"bearer {token}"})
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Failed to obtain Reddit access token: {e}")
+            return False
+    
     def _collect_from_subreddit(self, subreddit_name: str) -> List[Article]:
         """特定のサブレディットから投稿を収集"""
         articles = []
         
+        self.logger.info(f"Fetching posts from r/{subreddit_name}")
+        
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
+            # ホット投稿を取得（上位20個）
+            response = self.session.get(
+                f"{self.API_BASE_URL}/r/{subreddit_name}/hot",
+                params={"limit": 20, "raw_json": 1},
+                timeout=30
+            )
+            response.raise_for_status()
             
-            # 今日のホット投稿を取得（上位20個）
-            for submission in subreddit.hot(limit=20):
+            listing = orjson.loads(response.content)
+            
+            for child in listing.get("data", {}).get("children", []):
+                submission = child.get("data", {})
                 try:
                     article = self._create_article_from_submission(submission, subreddit_name)
                     if article:
                         articles.append(article)
                 except Exception as e:
-                    self.logger.error(f"Failed to process submission {submission.id}: {e}")
-                    
+                    self.logger.error(f"Failed to process submission {submission.get('id', 'unknown')}: {e}")
+        
         except Exception as e:
             self.logger.error(f"Failed to access subreddit r/{subreddit_name}: {e}")
         
         return articles
     
-    def _create_article_from_submission(self, submission, subreddit_name: str) -> Optional[Article]:
+    def _create_article_from_submission(self, submission: dict, subreddit_name: str) -> Optional[Article]:
         """Reddit投稿から記事を作成"""
         try:
             # 基本情報
-            title = submission.title
-            url = submission.url
+            title = submission.get("title", "")
+            url = submission.get("url", "")
             
             # テキスト投稿の場合はRedditのURLを使用
-            if submission.is_self:
-                url = f"https://reddit.com{submission.permalink}"
+            if submission.get("is_self"):
+                url = f"https://reddit.com{submission.get('permalink', '')}"
             
             # 投稿時刻
-            published_at = datetime.fromtimestamp(submission.created_utc)
+            published_at = datetime.fromtimestamp(submission.get("created_utc", 0))
             
             # 古い投稿は除外
-            if not self._is_recent(published_at, Config.HOURS_LOOKBACK):
+            if not self._is_recent(published_at):
                 return None
             
             # 概要を作成
@@ -100,8 +127,8 @@ class RedditCollector(BaseCollector):
             score = self._calculate_score(
                 title=title,
                 summary=summary,
-                upvotes=submission.score,
-                comments=submission.num_comments
+                upvotes=submission.get("score", 0),
+                comments=submission.get("num_comments", 0)
             )
             
             # 最小スコア未満は除外
@@ -112,6 +139,11 @@ class RedditCollector(BaseCollector):
             tags = self._extract_tags(title, summary)
             tags.append(f"r/{subreddit_name}")
             
+            # 削除済みユーザーは著者なしとして扱う
+            author = submission.get("author")
+            if author == "[deleted]":
+                author = None
+            
             article = Article(
                 title=self._clean_text(title),
                 url=url,
@@ -120,33 +152,35 @@ class RedditCollector(BaseCollector):
                 source="reddit",
                 tags=tags,
                 score=score,
-                content_hash="",  # __post_init__で生成される
-                author=submission.author.name if submission.author else None
+                content_hash=0,  # __post_init__で生成される
+                author=author
             )
             
             return article
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to create article from Reddit submission: {e}")
             return None
     
-    def _create_summary(self, submission) -> str:
+    def _create_summary(self, submission: dict) -> str:
         """投稿から概要を作成"""
         summary_parts = []
+        score = submission.get("score", 0)
         
         # セルフポストの場合は本文を使用
-        if submission.is_self and submission.selftext:
+        selftext = submission.get("selftext")
+        if submission.get("is_self") and selftext:
             # 本文の最初の200文字
-            text = submission.selftext.strip()
+            text = selftext.strip()
             if text:
                 summary_parts.append(text[:200])
         
         # 統計情報を追加
-        stats = f"👍 {submission.score} upvotes, 💬 {submission.num_comments} comments"
+        stats = f"👍 {score} upvotes, 💬 {submission.get('num_comments', 0)} comments"
         summary_parts.append(stats)
         
         # フレアがある場合は追加
-        if submission.link_flair_text:
-            summary_parts.append(f"[{submission.link_flair_text}]")
+        if submission.get("link_flair_text"):
+            summary_parts.append(f"[{submission['link_flair_text']}]")
         
-        return " | ".join(summary_parts) if summary_parts else f"Reddit post with {submission.score} upvotes"
\ No newline at end of file
+        return " | ".join(summary_parts) if summary_parts else f"Reddit post with {score} upvotes"
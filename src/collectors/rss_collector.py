@@ -1,7 +1,8 @@
 import feedparser
-from datetime import datetime
+import json
+import os
+from datetime import datetime, timezone
 from typing import List
-import time
 
 from .base_collector import BaseCollector
 from ..models.article import Article
@@ -11,35 +12,89 @@ from ..utils.config import Config
 class RSSCollector(BaseCollector):
     """RSS/Atom フィード収集クラス"""
     
+    # 同時に取得するフィード数の上限
+    MAX_WORKERS = 16
+    
     def __init__(self):
         super().__init__("rss")
         self.feeds = Config.RSS_FEEDS
+        self.cache_file = Config.RSS_CACHE_FILE
+        self.cache = {}
     
     def collect(self) -> List[Article]:
         """RSSフィードから記事を収集"""
+        self._begin_run()
         all_articles = []
+        self.cache = self._load_cache()
+        
+        futures = self._fetch_all(self._collect_from_feed, self.feeds)
         
-        for feed_config in self.feeds:
+        for feed_config, future in futures:
             try:
-                self.logger.info(f"Fetching RSS feed: {feed_config['url']}")
-                articles = self._collect_from_feed(feed_config)
+                articles = future.result()
                 all_articles.extend(articles)
                 self.logger.info(f"Collected {len(articles)} articles from {feed_config['source']}")
                 
-                # API制限対策で少し待機
-                time.sleep(1)
-                
             except Exception as e:
                 self.logger.error(f"Failed to fetch RSS feed {feed_config['url']}: {e}")
         
+        self._save_cache()
+        
         return all_articles
     
+    def _load_cache(self) -> dict:
+        """前回実行時のフィードキャッシュを読み込む"""
+        if not os.path.exists(self.cache_file):
+            return {}
+        
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Failed to load RSS cache {self.cache_file}: {e}")
+            return {}
+    
+    def _save_cache(self):
+        """フィードキャッシュを保存"""
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            self.logger.warning(f"Failed to save RSS cache {self.cache_file}: {e}")
+    
     def _collect_from_feed(self, feed_config: dict) -> List[Article]:
         """個別のRSSフィードから記事を収集"""
-        articles = []
+        articles: List[Article] = []
+        
+        url = feed_config["url"]
+        cached = self.cache.get(url, {})
+        
+        self.logger.info(f"Fetching RSS feed: {url}")
         
         try:
-            feed = feedparser.parse(feed_config["url"])
+            # 前回のETag/Last-Modifiedで条件付きGETを行う
+            # 本文内のリンクは使わないため、相対URL解決（pure Pythonで重い）は無効化する
+            # サニタイズは <script>/<style> を中身ごと除去するので有効のままにする
+            feed = feedparser.parse(
+                url,
+                etag=cached.get("etag"),
+                modified=cached.get("modified"),
+                resolve_relative_uris=False
+            )
+            
+            # 304 Not Modified の場合は新着なし
+            if feed.get("status") == 304:
+                self.logger.info(f"Feed not modified since last fetch: {url}")
+                return articles
+            
+            self.cache[url] = {
+                "etag": feed.get("etag"),
+                "modified": feed.get("modified"),
+                "last_fetched": datetime.now().isoformat()
+            }
             
             if feed.bozo:
                 self.logger.warning(f"Feed may have issues: {feed_config['url']}")
@@ -49,7 +104,7 @@ class RSSCollector(BaseCollector):
                     published_time = self._parse_published_time(entry)
                     
                     # 古い記事は除外
-                    if not self._is_recent(published_time, Config.HOURS_LOOKBACK):
+                    if not self._is_recent(published_time):
                         continue
                     
                     # 記事の概要を取得
@@ -61,6 +116,10 @@ class RSSCollector(BaseCollector):
                         summary=summary
                     )
                     
+                    # 除外対象（スコア0）はタグ抽出や記事生成を省略
+                    if not score:
+                        continue
+                    
                     # タグ抽出
                     tags = self._extract_tags(entry.title, summary)
                     
@@ -72,7 +131,7 @@ class RSSCollector(BaseCollector):
                         source=feed_config["source"],
                         tags=tags,
                         score=score,
-                        content_hash="",  # __post_init__で生成される
+                        content_hash=0,  # __post_init__で生成される
                         author=self._extract_author(entry)
                     )
                     
@@ -89,13 +148,15 @@ class RSSCollector(BaseCollector):
     
     def _parse_published_time(self, entry) -> datetime:
         """エントリの公開時刻をパース"""
+        # *_parsed はUTCのため、収集期間の判定に合わせてローカル時刻のnaiveなdatetimeに変換する
+        
         # published_parsed が利用可能な場合
         if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            return datetime(*entry.published_parsed[:6])
+            return datetime(*entry.published_parsed[:6]).replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
         
         # updated_parsed を代替として使用
         if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-            return datetime(*entry.updated_parsed[:6])
+            return datetime(*entry.updated_parsed[:6]).replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
         
         # パースできない場合は現在時刻を使用
         self.logger.warning(f"Could not parse publish time for: {entry.get('title', 'Unknown')}")
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 import hashlib
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """記事データモデル"""
     title: str                    # 記事タイトル
@@ -14,22 +14,26 @@ class Article:
     source: str                   # データソース（rss, github, reddit）
     tags: List[str]               # タグ・カテゴリ
     score: float                  # 重要度スコア（0.0-1.0）
-    content_hash: str             # 重複検出用ハッシュ
+    content_hash: int             # 重複検出用ハッシュ（64bit整数）
     author: Optional[str] = None  # 著者名
     
+    # ソース別絵文字
+    _EMOJI_MAP: ClassVar[dict] = {
+        "github": "🔧",
+        "reddit": "💬", 
+        "hackernews": "📰",
+        "techcrunch": "🚀",
+        "zenn": "📝",
+        "qiita": "💡"
+    }
+    
+    # スコア(0.0-1.0)を5段階の星で表示するためのテーブル
+    _STAR_TABLE: ClassVar[List[str]] = ["⭐" * i for i in range(6)]
+    
     def to_slack_message(self) -> dict:
         """Slack通知用メッセージ形式に変換"""
-        emoji_map = {
-            "github": "🔧",
-            "reddit": "💬", 
-            "hackernews": "📰",
-            "techcrunch": "🚀",
-            "zenn": "📝",
-            "qiita": "💡"
-        }
-        
-        emoji = emoji_map.get(self.source, "📰")
-        score_emoji = "⭐" * min(int(self.score * 5), 5)
+        emoji = self._EMOJI_MAP.get(self.source, "📰")
+        score_emoji = self._STAR_TABLE[min(int(self.score * 5), 5)]
         
         return {
             "blocks": [
@@ -49,10 +53,11 @@ class Article:
         }
     
     @classmethod
-    def generate_content_hash(cls, title: str, url: str) -> str:
+    def generate_content_hash(cls, title: str, url: str) -> int:
         """タイトルとURLから重複検出用ハッシュを生成"""
         content = f"{title.lower()}{url.lower()}"
-        return hashlib.md5(content.encode()).hexdigest()
+        digest = hashlib.blake2b(content.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
     
     def __post_init__(self):
         """初期化後の処理"""
@@ -1,7 +1,11 @@
+import gzip
+import orjson
 import requests
-import json
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from ..models.article import Article
 from ..utils.config import Config
@@ -11,9 +15,71 @@ from ..utils.logger import setup_logger
 class SlackNotifier:
     """Slack通知クラス"""
     
+    # ソース別絵文字
+    EMOJI_MAP = {
+        "github": "🔧",
+        "reddit": "💬", 
+        "hackernews": "📰",
+        "techcrunch": "🚀",
+        "venturebeat": "💼",
+        "zenn": "📝",
+        "qiita": "💡"
+    }
+    
+    # スコア(0.0-1.0)を5段階の星で表示するためのテーブル
+    STAR_TABLE = ["⭐" * i for i in range(6)]
+    
+    # Slackの1メッセージあたりのブロック数上限
+    MAX_BLOCKS_PER_MESSAGE = 50
+    
+    # 区切りブロック
+    DIVIDER_BLOCK = {"type": "divider"}
+    
+    # このバイト数を超えるペイロードはgzip圧縮して送る
+    GZIP_MIN_PAYLOAD_SIZE = 4096
+    
+    # 圧縮したペイロードを受け付けない場合に返るステータス
+    GZIP_REJECTED_STATUSES = (400, 415)
+    
+    # エラー通知をまとめて送るまでの待ち時間（秒）
+    ERROR_FLUSH_DELAY = 2.0
+    
+    # Slackのセクションブロックのテキスト上限
+    MAX_SECTION_TEXT_LENGTH = 3000
+    
     def __init__(self):
         self.logger = setup_logger("slack_notifier")
         self.webhook_url = Config.SLACK_WEBHOOK_URL
+        self.session = self._create_session()
+        
+        # 圧縮が拒否されたら以降は非圧縮で送る
+        self._gzip_ok = True
+        
+        # 短時間に発生したエラーは1通にまとめて送信する
+        self._err_queue: List[str] = []
+        self._err_lock = threading.Lock()
+        self._err_timer: Optional[threading.Timer] = None
+    
+    def _create_session(self) -> requests.Session:
+        """接続を使い回すためのセッションを作成"""
+        session = requests.Session()
+        session.headers.update({'Content-Type': 'application/json'})
+        
+        # 一時的なエラーやレート制限(429)は短いバックオフで再試行する
+        # 送信済みの可能性がある読み取りタイムアウトは二重投稿を避けるため再試行しない
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        return session
     
     def send_daily_summary(self, articles: List[Article]) -> bool:
         """日次サマリーをSlackに送信"""
@@ -32,34 +98,62 @@ class SlackNotifier:
             # メッセージ作成
             message = self._create_summary_message(top_articles)
             
-            # Slack送信
-            response = requests.post(
-                self.webhook_url,
-                headers={'Content-Type': 'application/json'},
-                data=json.dumps(message),
-                timeout=30
-            )
+            # Slack送信（ブロック数上限を超える場合のみ分割して送る）
+            for chunk in self._split_message(message):
+                response = self._post_message(chunk)
+                
+                if response.status_code != 200:
+                    self.logger.error(f"Failed to send to Slack: {response.status_code} - {response.text}")
+                    return False
             
-            if response.status_code == 200:
-                self.logger.info(f"Successfully sent {len(top_articles)} articles to Slack")
-                return True
-            else:
-                self.logger.error(f"Failed to send to Slack: {response.status_code} - {response.text}")
-                return False
+            self.logger.info(f"Successfully sent {len(top_articles)} articles to Slack")
+            return True
                 
         except Exception as e:
             self.logger.error(f"Error sending to Slack: {e}")
             return False
     
+    def _post_message(self, message: dict) -> requests.Response:
+        """メッセージをWebhookに送信（大きなペイロードはgzip圧縮）"""
+        payload = orjson.dumps(message)
+        
+        if self._gzip_ok and len(payload) > self.GZIP_MIN_PAYLOAD_SIZE:
+            response = self.session.post(
+                self.webhook_url,
+                data=gzip.compress(payload, compresslevel=1),
+                headers={'Content-Encoding': 'gzip'},
+                timeout=30
+            )
+            if response.status_code not in self.GZIP_REJECTED_STATUSES:
+                return response
+            
+            # 圧縮を受け付けない経路の場合は記録し、非圧縮で送り直す
+            self._gzip_ok = False
+            self.logger.warning(f"Compressed payload rejected ({response.status_code}), sending uncompressed from now on")
+        
+        return self.session.post(
+            self.webhook_url,
+            data=payload,
+            timeout=30
+        )
+    
+    def _split_message(self, message: dict) -> List[dict]:
+        """ブロック数の上限ごとにメッセージを分割"""
+        blocks = message["blocks"]
+        if len(blocks) <= self.MAX_BLOCKS_PER_MESSAGE:
+            return [message]
+        
+        return [
+            {"blocks": blocks[i:i + self.MAX_BLOCKS_PER_MESSAGE]}
+            for i in range(0, len(blocks), self.MAX_BLOCKS_PER_MESSAGE)
+        ]
+    
     def _create_summary_message(self, articles: List[Article]) -> dict:
         """サマリーメッセージを作成"""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
         
         # ヘッダーブロック
-        header_text = f"🚀 *Tech News Daily Summary* - {current_time}\n\n"
-        header_text += f"Found {len(articles)} top tech articles for you:"
-        
-        blocks = [
+        header_blocks = [
             {
                 "type": "header",
                 "text": {
@@ -74,19 +168,15 @@ class SlackNotifier:
                     "text": f"*{current_time}* | {len(articles)} top articles"
                 }
             },
-            {
-                "type": "divider"
-            }
+            self.DIVIDER_BLOCK
         ]
         
-        # 各記事のブロック
-        for i, article in enumerate(articles, 1):
-            article_block = self._create_article_block(article, i)
-            blocks.append(article_block)
-            
-            # 記事間の区切り（最後の記事以外）
-            if i < len(articles):
-                blocks.append({"type": "divider"})
+        # 各記事のブロック（記事ごとに区切りを付け、最後の区切りだけ除く）
+        article_blocks = [
+            block
+            for i, article in enumerate(articles, 1)
+            for block in (self._create_article_block(article, i), self.DIVIDER_BLOCK)
+        ][:-1]
         
         # フッターブロック
         footer_block = {
@@ -98,25 +188,13 @@ class SlackNotifier:
                 }
             ]
         }
-        blocks.append(footer_block)
         
-        return {"blocks": blocks}
+        return {"blocks": [*header_blocks, *article_blocks, footer_block]}
     
     def _create_article_block(self, article: Article, index: int) -> dict:
         """個別記事のブロックを作成"""
-        # ソース別絵文字
-        emoji_map = {
-            "github": "🔧",
-            "reddit": "💬", 
-            "hackernews": "📰",
-            "techcrunch": "🚀",
-            "venturebeat": "💼",
-            "zenn": "📝",
-            "qiita": "💡"
-        }
-        
-        emoji = emoji_map.get(article.source, "📰")
-        score_stars = "⭐" * min(int(article.score * 5), 5)
+        emoji = self.EMOJI_MAP.get(article.source, "📰")
+        score_stars = self.STAR_TABLE[min(int(article.score * 5), 5)]
         
         # タグ表示（最大3個）
         tags_text = ""
@@ -152,47 +230,86 @@ class SlackNotifier:
         }
     
     def send_error_notification(self, error_message: str) -> bool:
-        """エラー通知を送信"""
+        """エラー通知をキューに追加（ERROR_FLUSH_DELAY 秒以内のものはまとめて送信）
+        
+        戻り値はキューに追加できたかどうか。送信結果は flush_error_notifications の戻り値で分かる。
+        """
         if not self.webhook_url:
             return False
         
+        with self._err_lock:
+            self._err_queue.append(error_message)
+            
+            if self._err_timer is None:
+                # プロセス終了時にも送信されるよう daemon にはしない
+                self._err_timer = threading.Timer(self.ERROR_FLUSH_DELAY, self.flush_error_notifications)
+                self._err_timer.start()
+        
+        return True
+    
+    def flush_error_notifications(self) -> bool:
+        """キューに溜まったエラー通知を1通にまとめて送信"""
+        with self._err_lock:
+            error_messages, self._err_queue = self._err_queue, []
+            
+            if self._err_timer is not None:
+                self._err_timer.cancel()
+                self._err_timer = None
+        
+        if not error_messages:
+            return True
+        
         try:
-            message = {
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "⚠️ Tech News Bot Error"
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"An error occurred during news collection:\n\n```{error_message}```"
-                        }
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                            }
-                        ]
-                    }
-                ]
-            }
+            message = self._create_error_message(error_messages)
+            response = self._post_message(message)
             
-            response = requests.post(
-                self.webhook_url,
-                headers={'Content-Type': 'application/json'},
-                data=json.dumps(message),
-                timeout=30
-            )
+            if response.status_code != 200:
+                self.logger.error(f"Failed to send error notification: {response.status_code} - {response.text}")
+                return False
             
-            return response.status_code == 200
+            return True
             
-        except Exception:
-            return False
\ No newline at end of file
+        except Exception as e:
+            self.logger.error(f"Error sending error notification: {e}")
+            return False
+    
+    def _create_error_message(self, error_messages: List[str]) -> dict:
+        """エラー通知メッセージを作成"""
+        if len(error_messages) == 1:
+            intro = "An error occurred during news collection:"
+        else:
+            intro = f"{len(error_messages)} errors occurred during news collection:"
+        
+        # セクションの文字数上限に収まるようエラー内容を切り詰める
+        details = "\n".join(error_messages)
+        max_details_length = self.MAX_SECTION_TEXT_LENGTH - len(intro) - 10
+        if len(details) > max_details_length:
+            details = details[:max_details_length - 3] + "..."
+        
+        return {
+            "blocks": [
+                {
+                    "type": "header",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "⚠️ Tech News Bot Error"
+                    }
+                },
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"{intro}\n\n```{details}```"
+                    }
+                },
+                {
+                    "type": "context",
+                    "elements": [
+                        {
+                            "type": "mrkdwn",
+                            "text": f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                        }
+                    ]
+                }
+            ]
+        }
@@ -22,11 +22,9 @@ class ArticleProcessor:
         unique_articles = self.deduplicator.remove_duplicates(articles)
         
         # 2. コンテンツフィルタリング
+        # (スコア順の上位選択は呼び出し側で必要な件数だけ行う)
         filtered_articles = self.content_filter.filter(unique_articles)
         
-        # 3. スコアベースソート
-        sorted_articles = sorted(filtered_articles, key=lambda x: x.score, reverse=True)
+        self.logger.info(f"Article processing completed: {len(filtered_articles)} articles")
         
-        self.logger.info(f"Article processing completed: {len(sorted_articles)} articles")
-        
-        return sorted_articles
\ No newline at end of file
+        return filtered_articles
\ No newline at end of file
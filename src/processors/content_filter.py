@@ -1,119 +1,136 @@
 import re
+from collections import Counter
 from typing import List
 
 from ..models.article import Article
 from ..utils.config import Config
+from ..utils.keyword_matcher import compile_keywords
 from ..utils.logger import setup_logger
 
 
+# キーワードは部分一致で判定するため単語境界なしでまとめてコンパイルする
+# （Config 側で小文字化済み）
+_TECH_KEYWORDS_RE = compile_keywords(Config.TECH_KEYWORDS, word_boundary=False)
+_EXCLUDE_KEYWORDS_RE = compile_keywords(Config.EXCLUDE_KEYWORDS, word_boundary=False)
+
+# 無条件で技術記事とみなすソース
+_TECH_SOURCES = frozenset({"github", "hackernews", "zenn", "qiita"})
+
+# 技術系サブレディットのタグ（小文字）
+_TECH_SUBS = frozenset({"r/programming", "r/webdev", "r/machinelearning", "r/devops"})
+
+
 class ContentFilter:
     """コンテンツフィルタリングクラス"""
     
+    # スパムの特徴パターン
+    _SPAM_PATTERNS = (
+        r'\b(buy now|click here|limited time|act fast)\b',
+        r'\b(make money|get rich|earn \$\d+)\b',
+        r'\b(free trial|no credit card|risk free)\b',
+        r'[!]{3,}',  # 過度の感嘆符
+        r'[A-Z]{10,}',  # 過度の大文字
+        r'\b(crypto|bitcoin|ethereum).*(profit|investment|trading)\b'
+    )
+    
+    # 全パターンを1つに連結し、テキストを1回の走査で判定する
+    _SPAM_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _SPAM_PATTERNS), re.IGNORECASE)
+    
+    # 意味のないタイトルのパターン
+    _MEANINGLESS_RES = [
+        re.compile(pattern) for pattern in (
+            r'^(test|testing|hello|hi)$',
+            r'^[a-z]{1,3}$',  # 短すぎる
+            r'^\d+$',  # 数字のみ
+        )
+    ]
+    
     def __init__(self):
         self.logger = setup_logger("content_filter")
+        
+        # 判定ごとの除外件数（判定順の見直しに使う）
+        self.rejection_counts: Counter = Counter()
     
     def filter(self, articles: List[Article]) -> List[Article]:
         """記事をフィルタリング"""
-        filtered_articles = []
-        filtered_count = 0
+        # 1. スコアによるフィルタリング
+        # 最も安価な判定なので、以降の正規表現による判定の前にまとめて除外する
+        threshold = Config.MIN_SCORE_THRESHOLD
+        candidates = [article for article in articles if article.score >= threshold]
+        self.rejection_counts["low_score"] += len(articles) - len(candidates)
         
-        for article in articles:
-            if self._should_include(article):
-                filtered_articles.append(article)
-            else:
-                filtered_count += 1
+        filtered_articles = [article for article in candidates if self._should_include(article)]
+        filtered_count = len(articles) - len(filtered_articles)
         
         self.logger.info(f"Filtered out {filtered_count} articles")
+        self.logger.info(f"Rejections by check: {dict(self.rejection_counts)}")
         self.logger.info(f"Remaining articles: {len(filtered_articles)}")
         
         return filtered_articles
     
     def _should_include(self, article: Article) -> bool:
-        """記事を含めるべきかどうか判定"""
+        """記事を含めるべきかどうか判定（スコアの閾値判定は filter で実施済み）"""
         
-        # 1. スコアによるフィルタリング
-        if article.score < Config.MIN_SCORE_THRESHOLD:
-            self.logger.debug(f"Filtered by low score: {article.title} (score: {article.score})")
-            return False
+        # 小文字化は1回だけ行い、各判定で使い回す
+        title_lower = article.title.lower()
+        text_lower = f"{title_lower} {article.summary.lower()}"
+        
+        # 安価で除外率の高い判定から順に行う
         
-        # 2. 除外キーワードチェック
-        if self._contains_exclude_keywords(article):
-            self.logger.debug(f"Filtered by exclude keywords: {article.title}")
+        # 2. 最小品質チェック（長さ・URL形式など）
+        if not self._meets_quality_standards(article, title_lower):
+            self.logger.debug("Filtered by quality: %s", article.title)
+            self.rejection_counts["quality"] += 1
             return False
         
-        # 3. スパムコンテンツチェック
-        if self._is_spam_content(article):
-            self.logger.debug(f"Filtered as spam: {article.title}")
+        # 3. 除外キーワードチェック
+        if self._contains_exclude_keywords(text_lower):
+            self.logger.debug("Filtered by exclude keywords: %s", article.title)
+            self.rejection_counts["exclude_keywords"] += 1
             return False
         
-        # 4. 技術関連コンテンツチェック
-        if not self._is_tech_related(article):
-            self.logger.debug(f"Filtered as non-tech: {article.title}")
+        # 4. スパムコンテンツチェック
+        if self._is_spam_content(text_lower):
+            self.logger.debug("Filtered as spam: %s", article.title)
+            self.rejection_counts["spam"] += 1
             return False
         
-        # 5. 最小品質チェック
-        if not self._meets_quality_standards(article):
-            self.logger.debug(f"Filtered by quality: {article.title}")
+        # 5. 技術関連コンテンツチェック
+        if not self._is_tech_related(article, text_lower):
+            self.logger.debug("Filtered as non-tech: %s", article.title)
+            self.rejection_counts["non_tech"] += 1
             return False
         
         return True
     
-    def _contains_exclude_keywords(self, article: Article) -> bool:
-        """除外キーワードが含まれているかチェック"""
-        text = f"{article.title} {article.summary}".lower()
-        
-        for keyword in Config.EXCLUDE_KEYWORDS:
-            if keyword.lower() in text:
-                return True
-        
-        return False
+    def _contains_exclude_keywords(self, text_lower: str) -> bool:
+        """除外キーワードが含まれているかチェック（小文字化済みのタイトル+概要）"""
+        return _EXCLUDE_KEYWORDS_RE.search(text_lower) is not None
     
-    def _is_spam_content(self, article: Article) -> bool:
-        """スパムコンテンツかどうかチェック"""
-        title = article.title.lower()
-        summary = article.summary.lower()
-        
-        # スパムの特徴パターン
-        spam_patterns = [
-            r'\b(buy now|click here|limited time|act fast)\b',
-            r'\b(make money|get rich|earn \$\d+)\b',
-            r'\b(free trial|no credit card|risk free)\b',
-            r'[!]{3,}',  # 過度の感嘆符
-            r'[A-Z]{10,}',  # 過度の大文字
-            r'\b(crypto|bitcoin|ethereum).*(profit|investment|trading)\b'
-        ]
-        
-        text = f"{title} {summary}"
-        for pattern in spam_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+    def _is_spam_content(self, text_lower: str) -> bool:
+        """スパムコンテンツかどうかチェック（小文字化済みのタイトル+概要）"""
+        return self._SPAM_RE.search(text_lower) is not None
     
-    def _is_tech_related(self, article: Article) -> bool:
+    def _is_tech_related(self, article: Article, text_lower: str) -> bool:
         """技術関連の記事かどうかチェック"""
-        text = f"{article.title} {article.summary} {' '.join(article.tags)}".lower()
+        text = f"{text_lower} {' '.join(article.tags).lower()}"
         
         # 技術キーワードがあれば通す
-        for keyword in Config.TECH_KEYWORDS:
-            if keyword.lower() in text:
-                return True
+        if _TECH_KEYWORDS_RE.search(text):
+            return True
         
         # ソース別の判定
-        tech_sources = ["github", "hackernews", "zenn", "qiita"]
-        if article.source in tech_sources:
+        if article.source in _TECH_SOURCES:
             return True
         
         # Reddit の場合は技術系サブレディットか確認
         if article.source == "reddit":
-            tech_subreddits = ["r/programming", "r/webdev", "r/machinelearning", "r/devops"]
-            for tag in article.tags:
-                if any(sub in tag for sub in tech_subreddits):
-                    return True
+            if {tag.lower() for tag in article.tags} & _TECH_SUBS:
+                return True
         
         return False
     
-    def _meets_quality_standards(self, article: Article) -> bool:
+    def _meets_quality_standards(self, article: Article, title_lower: str) -> bool:
         """最小品質基準を満たしているかチェック"""
         
         # タイトルの長さチェック
@@ -125,15 +142,7 @@ class ContentFilter:
             return False
         
         # タイトルが意味のある内容かチェック
-        title_lower = article.title.lower()
-        meaningless_patterns = [
-            r'^(test|testing|hello|hi)$',
-            r'^[a-z]{1,3}$',  # 短すぎる
-            r'^\d+$',  # 数字のみ
-        ]
-        
-        for pattern in meaningless_patterns:
-            if re.match(pattern, title_lower):
-                return False
+        if any(pattern.match(title_lower) for pattern in self._MEANINGLESS_RES):
+            return False
         
         return True
\ No newline at end of file
@@ -1,18 +1,47 @@
-from typing import List, Set
+import re
 from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
 from ..models.article import Article
 from ..utils.logger import setup_logger
 
+# datasketch がある場合はMinHash-LSHでタイトルの類似判定を行う
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
+# タイトルの指紋（小文字化したタイトルと、LSH使用時はそのMinHash）
+TitleFingerprint = Tuple[str, Optional["MinHash"]]
+
 
 class Deduplicator:
     """記事の重複除去クラス"""
     
+    # タイトル類似度の閾値
+    SIMILARITY_THRESHOLD = 0.85
+    
+    # MinHashの設定
+    # LSHは候補の絞り込みにのみ使い、最終判定は SequenceMatcher で行うため閾値は低めにする
+    LSH_CANDIDATE_THRESHOLD = 0.5
+    NUM_PERM = 64
+    SHINGLE_SIZE = 5
+    
     def __init__(self):
         self.logger = setup_logger("deduplicator")
-        self.seen_hashes: Set[str] = set()
+        self.seen_hashes: Set[int] = set()
         self.seen_urls: Set[str] = set()
         self.seen_titles: List[str] = []
+        
+        # LSHに登録する際のキー採番用と、キーから小文字化したタイトルへの対応
+        self._lsh_key_counter = 0
+        self._lsh_titles: Dict[str, str] = {}
+        
+        self.lsh = None
+        if MinHashLSH is not None:
+            self.lsh = MinHashLSH(threshold=self.LSH_CANDIDATE_THRESHOLD, num_perm=self.NUM_PERM)
     
     def remove_duplicates(self, articles: List[Article]) -> List[Article]:
         """重複記事を除去"""
@@ -20,67 +49,123 @@ class Deduplicator:
         duplicates_count = 0
         
         for article in articles:
-            if self._is_duplicate(article):
+            # 正規化したURLとタイトルの指紋は重複判定と記録の両方で使うため1回だけ計算
+            normalized_url = self._normalize_url(article.url)
+            title_fingerprint = self._title_fingerprint(article.title)
+            
+            if self._is_duplicate(article, normalized_url, title_fingerprint):
                 duplicates_count += 1
                 continue
             
             # 重複でない場合は追加
             unique_articles.append(article)
-            self._mark_as_seen(article)
+            self._mark_as_seen(article, normalized_url, title_fingerprint)
         
         self.logger.info(f"Removed {duplicates_count} duplicate articles out of {len(articles)}")
         self.logger.info(f"Unique articles: {len(unique_articles)}")
         
         return unique_articles
     
-    def _is_duplicate(self, article: Article) -> bool:
+    def _is_duplicate(self, article: Article, normalized_url: str, title_fingerprint: TitleFingerprint) -> bool:
         """記事が重複かどうかチェック"""
         
         # 1. コンテンツハッシュによる完全一致チェック
         if article.content_hash in self.seen_hashes:
-            self.logger.debug(f"Duplicate by hash: {article.title}")
+            self.logger.debug("Duplicate by hash: %s", article.title)
             return True
         
         # 2. URLによる重複チェック
-        normalized_url = self._normalize_url(article.url)
         if normalized_url in self.seen_urls:
-            self.logger.debug(f"Duplicate by URL: {article.title}")
+            self.logger.debug("Duplicate by URL: %s", article.title)
             return True
         
         # 3. タイトルの類似度による重複チェック
-        if self._is_similar_title(article.title):
-            self.logger.debug(f"Duplicate by similar title: {article.title}")
+        if self._is_similar_title(title_fingerprint):
+            self.logger.debug("Duplicate by similar title: %s", article.title)
             return True
         
         return False
     
-    def _mark_as_seen(self, article: Article):
+    def _mark_as_seen(self, article: Article, normalized_url: str, title_fingerprint: TitleFingerprint):
         """記事を既知として記録"""
         self.seen_hashes.add(article.content_hash)
-        self.seen_urls.add(self._normalize_url(article.url))
-        self.seen_titles.append(article.title.lower())
+        self.seen_urls.add(normalized_url)
+        
+        title_lower, minhash = title_fingerprint
+        if self.lsh is not None:
+            self._lsh_key_counter += 1
+            key = str(self._lsh_key_counter)
+            self.lsh.insert(key, minhash)
+            self._lsh_titles[key] = title_lower
+        else:
+            self.seen_titles.append(title_lower)
     
-    def _normalize_url(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_url(url: str) -> str:
         """URLを正規化"""
-        # URLパラメータやフラグメントを除去
-        url = url.split('?')[0].split('#')[0]
+        url = url.lower()
         
-        # 末尾のスラッシュを除去
-        url = url.rstrip('/')
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            # urlsplit が解釈できない不正なURL（"http://[bad/x" など）は文字列操作で正規化する
+            url = url.split('?')[0].split('#')[0].rstrip('/')
+            if url.startswith('http://'):
+                url = 'https://' + url[len('http://'):]
+            return url
         
         # プロトコルを統一
-        if url.startswith('http://'):
-            url = url.replace('http://', 'https://')
+        scheme = 'https' if parts.scheme in ('http', 'https') else parts.scheme
+        
+        # URLパラメータやフラグメント、末尾のスラッシュを除去
+        return urlunsplit((scheme, parts.netloc, parts.path.rstrip('/'), '', ''))
+    
+    def _title_shingles(self, title: str) -> Set[str]:
+        """タイトルを正規化し、文字単位のシングルに分割"""
+        # 単語の区切りを持たない日本語タイトルも扱えるよう文字n-gramを使用
+        text = " ".join(re.findall(r"\w+", title.lower()))
+        if len(text) <= self.SHINGLE_SIZE:
+            return {text}
         
-        return url.lower()
+        return {text[i:i + self.SHINGLE_SIZE] for i in range(len(text) - self.SHINGLE_SIZE + 1)}
+    
+    def _title_minhash(self, title: str) -> "MinHash":
+        """タイトルのMinHashを計算"""
+        minhash = MinHash(num_perm=self.NUM_PERM)
+        minhash.update_batch([shingle.encode() for shingle in self._title_shingles(title)])
+        return minhash
+    
+    def _title_fingerprint(self, title: str) -> TitleFingerprint:
+        """類似判定に使うタイトルの指紋を計算"""
+        minhash = self._title_minhash(title) if self.lsh is not None else None
+        return title.lower(), minhash
     
-    def _is_similar_title(self, title: str, threshold: float = 0.85) -> bool:
+    def _is_similar_title(self, title_fingerprint: TitleFingerprint, threshold: float = SIMILARITY_THRESHOLD) -> bool:
         """タイトルが既存のものと類似しているかチェック"""
-        title_lower = title.lower()
+        title_lower, minhash = title_fingerprint
+        
+        # LSH使用時はバケットが重なるタイトルだけを候補とし、判定基準はフォールバックと揃える
+        if self.lsh is not None:
+            candidates = [self._lsh_titles[key] for key in self.lsh.query(minhash)]
+        else:
+            candidates = self.seen_titles
+        
+        matcher = SequenceMatcher(None, title_lower)
+        title_length = len(title_lower)
         
-        for seen_title in self.seen_titles:
-            similarity = SequenceMatcher(None, title_lower, seen_title).ratio()
-            if similarity >= threshold:
+        for seen_title in candidates:
+            # 長さだけで決まる上限（real_quick_ratio() と同じ値）で、
+            # seq2 の索引を作り直す set_seq2 の前に候補を絞り込む
+            total_length = title_length + len(seen_title)
+            if total_length and 2.0 * min(title_length, len(seen_title)) / total_length < threshold:
+                continue
+            
+            # 残った候補は文字の出現数による上限で絞り込み、最後に厳密に計算
+            matcher.set_seq2(seen_title)
+            if matcher.quick_ratio() < threshold:
+                continue
+            if matcher.ratio() >= threshold:
                 return True
         
-        return False
\ No newline at end of file
+        return False
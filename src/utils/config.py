@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import FrozenSet, Optional
 
 
 class Config:
@@ -24,28 +24,31 @@ class Config:
         {"url": "https://qiita.com/popular-items/feed", "source": "qiita"},
     ]
     
+    # RSS の ETag / Last-Modified を実行間で保持するキャッシュファイル
+    RSS_CACHE_FILE: str = os.getenv('RSS_CACHE_FILE', '.cache/rss_feeds.json')
+    
     # GitHub設定
     GITHUB_TRENDING_LANGUAGES = ["python", "javascript", "typescript", "go", "rust"]
     
     # Reddit設定  
-    REDDIT_SUBREDDITS = ["programming", "webdev", "MachineLearning", "devops"]
+    REDDIT_SUBREDDITS = ("programming", "webdev", "MachineLearning", "devops")
     
     # フィルタリング設定
     MIN_SCORE_THRESHOLD = 0.3
     MAX_ARTICLES_PER_NOTIFICATION = 10
     HOURS_LOOKBACK = 12  # 何時間前までの記事を収集するか
     
-    # キーワードフィルタ
-    TECH_KEYWORDS = [
+    # キーワードフィルタ（判定は小文字で行うため読み込み時に小文字化しておく）
+    TECH_KEYWORDS: FrozenSet[str] = frozenset(keyword.lower() for keyword in [
         "ai", "machine learning", "python", "javascript", "react", "node.js",
         "docker", "kubernetes", "aws", "cloud", "api", "microservices",
         "blockchain", "cryptocurrency", "web3", "rust", "go", "typescript",
         "frontend", "backend", "devops", "cicd", "database", "security"
-    ]
+    ])
     
-    EXCLUDE_KEYWORDS = [
+    EXCLUDE_KEYWORDS: FrozenSet[str] = frozenset(keyword.lower() for keyword in [
         "crypto scam", "investment", "trading signals", "buy now", "advertisement"
-    ]
+    ])
     
     @classmethod
     def validate(cls) -> bool:
@@ -0,0 +1,68 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+
+def compile_keywords(keywords: Iterable[str], word_boundary: bool = True) -> "re.Pattern":
+    """キーワード群をトライ木に畳み込んだ1つの正規表現にコンパイルする
+    
+    "go", "golang", "google" のように共通接頭辞を持つキーワードを
+    "go(?:lang|ogle)?" の形にまとめるため、キーワード数が増えても
+    各位置での分岐は1文字ずつの判定で済み、バックトラックが増えない。
+    マッチしたキーワードはグループ1で取得できる。
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    # キーワードが空の場合は何にもマッチしないパターンにする
+    pattern = f"({_trie_to_pattern(trie) or '(?!)'})" if trie else "((?!))"
+    if word_boundary:
+        pattern = rf"\b{pattern}\b"
+    
+    return re.compile(pattern)
+
+
+def _trie_to_pattern(node: dict) -> Optional[str]:
+    """トライ木のノードを正規表現に変換（終端のみのノードはNone）"""
+    if "" in node and len(node) == 1:
+        return None
+    
+    alternatives: List[str] = []
+    single_chars: List[str] = []
+    optional = False
+    
+    for char in sorted(node):
+        if char == "":
+            optional = True
+            continue
+        
+        sub_pattern = _trie_to_pattern(node[char])
+        if sub_pattern is None:
+            single_chars.append(re.escape(char))
+        else:
+            alternatives.append(re.escape(char) + sub_pattern)
+    
+    chars_only = not alternatives
+    
+    if single_chars:
+        if len(single_chars) == 1:
+            alternatives.append(single_chars[0])
+        else:
+            alternatives.append(f"[{''.join(single_chars)}]")
+    
+    if len(alternatives) == 1:
+        result = alternatives[0]
+    else:
+        result = f"(?:{'|'.join(alternatives)})"
+    
+    # ここで終わるキーワードもある場合は、以降を省略可能にする
+    if optional:
+        if chars_only:
+            result += "?"
+        else:
+            result = f"(?:{result})?"
+    
+    return result
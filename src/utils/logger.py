@@ -4,28 +4,27 @@ from datetime import datetime
 from typing import Optional
 
 
+# ハンドラー設定を済ませたかどうか
+_CONFIGURED = False
+
+
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """ロガーをセットアップ"""
+    global _CONFIGURED
+    
+    # ハンドラーとフォーマッターはルートロガーに一度だけ設定する
+    if not _CONFIGURED:
+        logging.basicConfig(
+            level=level,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+            stream=sys.stdout
+        )
+        _CONFIGURED = True
     
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # 既存のハンドラーがある場合は削除
-    if logger.handlers:
-        logger.handlers.clear()
-    
-    # フォーマッター作成
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # コンソールハンドラー
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
     return logger
 
 
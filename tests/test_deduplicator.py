@@ -0,0 +1,90 @@
+from datetime import datetime
+
+import pytest
+
+from src.models.article import Article
+from src.processors import deduplicator
+from src.processors.deduplicator import Deduplicator
+
+
+HEADLINES = [
+    "Show HN: My new Rust web framework",
+    "Python 3.13 released with experimental free-threaded mode",
+    "Kubernetes 1.29 deprecates legacy in-tree storage drivers",
+    "How we cut our AWS bill by 40% with spot instances",
+    "TypeScript 5.3 adds import attributes and narrowing improvements",
+    "Understanding the Linux kernel scheduler in 2024",
+    "Docker Desktop now supports WebAssembly containers",
+    "ReactとTypeScriptで始めるモダンフロントエンド開発入門",
+    "Go 1.22のループ変数セマンティクス変更を解説する",
+    "An introduction to vector databases for machine learning engineers",
+]
+
+# 近似重複とみなすべき表記ゆれ
+VARIANTS = [
+    lambda title: f"{title} [video]",
+    lambda title: f"{title} (2024)",
+    lambda title: f"Ask HN: {title}",
+    lambda title: f"{title}!",
+    lambda title: title[:-1],
+]
+
+NEAR_DUPLICATE_PAIRS = [
+    (headline, variant(headline)) for headline in HEADLINES for variant in VARIANTS
+] + [
+    ("Show HN: My new Rust web framework", "Show HN: My new Rust web framework (v2)"),
+    ("ReactとTypeScriptで始めるモダンフロントエンド開発入門",
+     "【2024年版】ReactとTypeScriptで始めるモダンフロントエンド開発入門"),
+]
+
+DISTINCT_PAIRS = [
+    (HEADLINES[i], HEADLINES[j]) for i in range(len(HEADLINES)) for j in range(i + 1, len(HEADLINES))
+]
+
+
+def make_article(title: str, index: int) -> Article:
+    return Article(
+        title=title,
+        url=f"https://example.com/articles/{index}",
+        summary="summary",
+        published_at=datetime(2024, 1, 1),
+        source="hackernews",
+        tags=[],
+        score=0.5,
+        content_hash=0,
+    )
+
+
+@pytest.fixture(params=["fallback", "lsh"])
+def dedup(request, monkeypatch):
+    # datasketch の有無で判定結果が変わらないよう、両方の経路を検証する
+    if request.param == "lsh":
+        pytest.importorskip("datasketch")
+    else:
+        monkeypatch.setattr(deduplicator, "MinHashLSH", None)
+    return Deduplicator()
+
+
+@pytest.mark.parametrize("original, variant", NEAR_DUPLICATE_PAIRS)
+def test_near_duplicate_titles_are_removed(dedup, original, variant):
+    articles = [make_article(original, 1), make_article(variant, 2)]
+    
+    assert dedup.remove_duplicates(articles) == articles[:1]
+
+
+@pytest.mark.parametrize("first, second", DISTINCT_PAIRS)
+def test_distinct_titles_are_kept(dedup, first, second):
+    articles = [make_article(first, 1), make_article(second, 2)]
+    
+    assert dedup.remove_duplicates(articles) == articles
+
+
+def test_malformed_url_does_not_abort_deduplication(dedup):
+    articles = [
+        make_article("Show HN: My new Rust web framework", 1),
+        make_article("Python 3.13 released with experimental free-threaded mode", 2),
+    ]
+    articles[0].url = "http://[bad/x?ref=feed"
+    
+    assert dedup.remove_duplicates(articles) == articles
+    assert Deduplicator._normalize_url("HTTP://[bad/x/?ref=feed#top") == "https://[bad/x"
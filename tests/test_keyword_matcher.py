@@ -0,0 +1,58 @@
+import random
+import re
+
+import pytest
+
+from src.collectors.rss_collector import RSSCollector
+from src.utils.keyword_matcher import compile_keywords
+
+
+ALPHABET = "abgo.js +"
+
+
+def alternation_pattern(keywords, word_boundary):
+    # 比較対象: 長いキーワードを優先する素朴な選択
+    pattern = f"({'|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))})"
+    if word_boundary:
+        pattern = rf"\b{pattern}\b"
+    return re.compile(pattern)
+
+
+def random_keyword_sets(count):
+    rng = random.Random(0)
+    for _ in range(count):
+        keywords = {
+            "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 5)))
+            for _ in range(rng.randint(1, 12))
+        }
+        texts = ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40))) for _ in range(20)]
+        yield keywords, texts
+
+
+@pytest.mark.parametrize("word_boundary", [True, False])
+def test_matches_longest_first_alternation(word_boundary):
+    for keywords, texts in random_keyword_sets(500):
+        trie_re = compile_keywords(keywords, word_boundary=word_boundary)
+        expected_re = alternation_pattern(keywords, word_boundary)
+        
+        for text in texts:
+            assert trie_re.findall(text) == expected_re.findall(text), (keywords, text)
+
+
+def test_common_prefixes_prefer_longest_keyword():
+    pattern = compile_keywords(["go", "golang", "google"])
+    
+    assert pattern.findall("golang and go at google") == ["golang", "go", "google"]
+    assert pattern.findall("gopher") == []
+
+
+def test_empty_keywords_never_match():
+    assert compile_keywords([]).search("anything") is None
+    assert compile_keywords([], word_boundary=False).search("anything") is None
+
+
+def test_node_js_yields_both_tags():
+    collector = RSSCollector()
+    
+    assert collector._extract_tags("Node.js 22 released") == ["javascript", "nodejs"]
+    assert collector._extract_tags("Building an API with nodejs") == ["nodejs", "api"]